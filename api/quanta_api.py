@@ -51,6 +51,18 @@ class QuantaAPI:
         """
         return self.compressor.hash_capsule(capsule)
 
+    def hash_capsules(self, capsules: list[Capsule]) -> list[str]:
+        """
+        Hash a batch of capsules.
+
+        Args:
+            capsules: Capsules to hash
+
+        Returns:
+            SHA-256 hashes (hex), one per capsule
+        """
+        return self.compressor.hash_capsules(capsules)
+
     def compute_quanta(self, capsule: Capsule) -> float:
         """
         Compute QuantaCoin value for a capsule.
@@ -63,20 +75,7 @@ class QuantaAPI:
         Returns:
             QuantaCoin value (compression ratio)
         """
-        # Get raw size
-        raw_dict = capsule.encode()
-        import json
-        raw_json = json.dumps(raw_dict, sort_keys=True)
-        raw_size = len(raw_json.encode("utf-8"))
-        
-        # Get compressed size
-        compressed = self.compressor.compress_capsule(capsule)
-        compressed_size = len(compressed)
-        
-        # Compute compression ratio = QuantaCoin
-        quanta = self.compressor.compression_ratio(raw_json, compressed)
-        
-        return quanta
+        return self.compressor.compute_quanta(capsule)
 
     def mint_quanta(self, capsule: Capsule) -> dict[str, Any]:
         """
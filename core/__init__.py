@@ -7,8 +7,10 @@ from .pf_core import (
     PFOperator,
     PFShell,
     PFTriplet,
+    PFTripletType,
     PFFlux,
     PFManifoldState,
+    PFTripletArray,
     apply_operator,
     transition_shell,
     compute_curvature,
@@ -24,8 +26,10 @@ __all__ = [
     "PFOperator",
     "PFShell",
     "PFTriplet",
+    "PFTripletType",
     "PFFlux",
     "PFManifoldState",
+    "PFTripletArray",
     "apply_operator",
     "transition_shell",
     "compute_curvature",
@@ -14,12 +14,20 @@ flux operators, triplet logic, and shell transitions.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Protocol, Any
-from enum import Enum
+from dataclasses import dataclass, field, replace
+from typing import Protocol, Any, Iterable, Iterator
+from enum import Enum, IntEnum
 import math
 import collections
 
+from .numpy_fallback import np, HAS_NUMPY
+
+
+# Irrational constants used throughout PF math
+_SQRT2 = math.sqrt(2.0)
+_PHI = (1.0 + math.sqrt(5.0)) / 2.0  # Golden ratio
+_BASE_CURVATURE = (_SQRT2 + math.pi / _PHI) / math.e
+
 
 class PFShell(Enum):
     """PrimeFlux shell enumeration."""
@@ -29,7 +37,37 @@ class PFShell(Enum):
     COLLAPSE = 4
 
 
-@dataclass
+_VALID_SHELLS = frozenset(PFShell)
+
+# Next shell in the 0 → 2 → 3 → 4 → 0 cycle, indexed by shell value
+# (value 1 is not a shell and maps back to presence).
+_NEXT_SHELL = (
+    PFShell.MEASUREMENT,
+    PFShell.PRESENCE,
+    PFShell.FLUX,
+    PFShell.COLLAPSE,
+    PFShell.PRESENCE,
+)
+
+
+class PFTripletType(IntEnum):
+    """PrimeFlux triplet type, stored as a small integer code."""
+    PRESENCE = 0
+    TRIG = 1
+    COMBINATORICS = 2
+    UNKNOWN = 3
+
+    @property
+    def label(self) -> str:
+        """Lower-case type name ("presence", "trig", ...)."""
+        return self.name.lower()
+
+
+_TRIPLET_TYPES = tuple(PFTripletType)
+_TRIPLET_TYPE_BY_LABEL = {t.label: t for t in PFTripletType}
+
+
+@dataclass(slots=True)
 class PFState:
     """
     State of a PrimeFlux operation.
@@ -64,16 +102,150 @@ class PFState:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PFTriplet:
     """A PrimeFlux triplet (presence, trig, or combinatorics)."""
     a: float
     b: float
     c: float
-    triplet_type: str = "unknown"
+    triplet_type: PFTripletType = PFTripletType.UNKNOWN
+
+    def __post_init__(self) -> None:
+        """Accept legacy string type labels ("presence", "trig", ...)."""
+        if isinstance(self.triplet_type, str):
+            self.triplet_type = _TRIPLET_TYPE_BY_LABEL.get(
+                self.triplet_type, PFTripletType.UNKNOWN
+            )
+
+
+# Token count from which triplet_decomposition switches to the NumPy path.
+# Measured crossover is ~140 tokens (120: 68 vs 72 µs loop/NumPy, 150: 83 vs
+# 81 µs, 210: 114 vs 101 µs); below it the per-group loop is faster.
+_VECTORIZE_MIN_TOKENS = 200
 
 
-@dataclass
+class PFTripletArray:
+    """
+    Structure-of-arrays store for PF triplets.
+
+    Keeps the a/b/c components in one contiguous (3, n) float64 block and
+    the triplet types as int8 codes, so manifold math can sweep whole
+    columns instead of chasing PFTriplet objects. Integer indexing returns
+    a PFTriplet for row i; slicing returns a new PFTripletArray.
+
+    """
+
+    def __init__(self, triplets: Iterable[PFTriplet] = ()) -> None:
+        if not HAS_NUMPY:
+            raise ImportError("PFTripletArray requires numpy")
+        self._values = np.empty((3, 16), dtype=np.float64)
+        self._type_ids = np.empty(16, dtype=np.int8)
+        self._size = 0
+        self.extend(triplets)
+
+    @classmethod
+    def from_columns(
+        cls,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        type_ids: np.ndarray
+    ) -> PFTripletArray:
+        """Build an array directly from component and type-code columns."""
+        array = cls()
+        n = len(type_ids)
+        array._reserve(n)
+        array._values[0, :n] = a
+        array._values[1, :n] = b
+        array._values[2, :n] = c
+        array._type_ids[:n] = type_ids
+        array._size = n
+        return array
+
+    def _reserve(self, size: int) -> None:
+        """Grow the backing columns (amortized doubling) to hold size rows."""
+        capacity = self._type_ids.shape[0]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        values = np.empty((3, capacity), dtype=np.float64)
+        values[:, :self._size] = self._values[:, :self._size]
+        type_ids = np.empty(capacity, dtype=np.int8)
+        type_ids[:self._size] = self._type_ids[:self._size]
+        self._values = values
+        self._type_ids = type_ids
+
+    def append(self, triplet: PFTriplet) -> None:
+        """Append a single triplet."""
+        self._reserve(self._size + 1)
+        i = self._size
+        self._values[0, i] = triplet.a
+        self._values[1, i] = triplet.b
+        self._values[2, i] = triplet.c
+        self._type_ids[i] = triplet.triplet_type
+        self._size += 1
+
+    def extend(self, triplets: Iterable[PFTriplet]) -> None:
+        """Append many triplets in one columnar write."""
+        triplets = list(triplets)
+        if not triplets:
+            return
+        start = self._size
+        end = start + len(triplets)
+        self._reserve(end)
+        self._values[:, start:end] = np.array(
+            [(t.a, t.b, t.c) for t in triplets], dtype=np.float64
+        ).T
+        self._type_ids[start:end] = [t.triplet_type for t in triplets]
+        self._size = end
+
+    @property
+    def values(self) -> np.ndarray:
+        """All components as a (3, n) view: rows are a, b, c."""
+        return self._values[:, :self._size]
+
+    @property
+    def a(self) -> np.ndarray:
+        return self._values[0, :self._size]
+
+    @property
+    def b(self) -> np.ndarray:
+        return self._values[1, :self._size]
+
+    @property
+    def c(self) -> np.ndarray:
+        return self._values[2, :self._size]
+
+    @property
+    def type_ids(self) -> np.ndarray:
+        return self._type_ids[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, i: int | slice) -> PFTriplet | PFTripletArray:
+        if isinstance(i, slice):
+            a, b, c = self.values[:, i]
+            return PFTripletArray.from_columns(a, b, c, self.type_ids[i])
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError("PFTripletArray index out of range")
+        a, b, c = self._values[:, i].tolist()
+        return PFTriplet(a, b, c, _TRIPLET_TYPES[self._type_ids[i]])
+
+    def __iter__(self) -> Iterator[PFTriplet]:
+        for i in range(self._size):
+            yield self[i]
+
+    def as_tuples(self) -> list[tuple[float, float, float, PFTripletType]]:
+        """Return rows as (a, b, c, triplet_type) tuples."""
+        types = [_TRIPLET_TYPES[t] for t in self.type_ids.tolist()]
+        return list(zip(*self.values.tolist(), types))
+
+
+@dataclass(slots=True)
 class PFFlux:
     """Flux representation."""
     amplitude: float = 0.0
@@ -81,12 +253,12 @@ class PFFlux:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PFManifoldState:
     """State of a PrimeFlux manifold."""
     curvature: float = 0.0
     entropy: float = 0.0
-    triplets: list[PFTriplet] = field(default_factory=list)
+    triplets: list[PFTriplet] | PFTripletArray = field(default_factory=list)
     shell_history: list[PFShell] = field(default_factory=list)
 
 
@@ -150,7 +322,8 @@ def transition_shell(
     flux_amplitude: float | None = None,
     curvature_gradient: float | None = None,
     triplet_class: str | None = None,
-    combinatorics_stable: bool = True
+    combinatorics_stable: bool = True,
+    inplace: bool = False
 ) -> PFState:
     """
     Transition to the next shell in the PF sequence.
@@ -168,9 +341,10 @@ def transition_shell(
         curvature_gradient: Curvature gradient sign
         triplet_class: Triplet class identifier
         combinatorics_stable: Whether combinatorics structure is stable
+        inplace: Update and return `state` itself instead of a copy
 
     Returns:
-        New state with updated shell
+        New state with updated shell (or `state` when inplace)
     """
     # If flux amplitude is provided, use it to determine transition
     if flux_amplitude is not None:
@@ -204,17 +378,12 @@ def transition_shell(
     # Compute measurement error (error = continuation, not reduction)
     measurement_error = compute_measurement_error(state)
     
-    return PFState(
-        shell=new_shell,
-        value=state.value,
-        curvature=state.curvature,
-        entropy=state.entropy,
-        measurement_error=measurement_error,
-        triplet=state.triplet,
-        combinatorics=state.combinatorics,
-        lattice_position=state.lattice_position,
-        metadata=state.metadata
-    )
+    if inplace:
+        state.shell = new_shell
+        state.measurement_error = measurement_error
+        return state
+    
+    return replace(state, shell=new_shell, measurement_error=measurement_error)
 
 
 def compute_curvature(state: PFManifoldState) -> float:
@@ -234,26 +403,25 @@ def compute_curvature(state: PFManifoldState) -> float:
     Returns:
         Curvature scalar
     """
-    # Irrational constants
-    sqrt2 = math.sqrt(2.0)
-    pi = math.pi
-    phi = (1.0 + math.sqrt(5.0)) / 2.0  # Golden ratio
-    e = math.e
-    
-    # Base curvature from irrational constants
-    base_curvature = (sqrt2 + pi / phi) / e
+    # Base curvature from irrational constants (√2 + π/φ) / e
+    base_curvature = _BASE_CURVATURE
     
     # Triplet oscillation component
     triplet_oscillation = 0.0
-    if state.triplets:
+    if isinstance(state.triplets, PFTripletArray):
+        # Variance over every triplet component, swept column-wise
+        values = state.triplets.values
+        if values.size > 1:
+            triplet_oscillation = math.sqrt(float(values.var()))
+    elif state.triplets:
         # Compute variance in triplet values
         all_values = []
         for triplet in state.triplets:
-            all_values.extend([triplet.a, triplet.b, triplet.c])
+            all_values.extend((triplet.a, triplet.b, triplet.c))
         
         if len(all_values) > 1:
             mean_val = sum(all_values) / len(all_values)
-            variance = sum((v - mean_val) ** 2 for v in all_values) / len(all_values)
+            variance = sum([(v - mean_val) * (v - mean_val) for v in all_values]) / len(all_values)
             triplet_oscillation = math.sqrt(variance)
     
     # Distinction density component
@@ -265,6 +433,42 @@ def compute_curvature(state: PFManifoldState) -> float:
     return curvature
 
 
+def _triplet_values(triplets: list[PFTriplet] | PFTripletArray) -> np.ndarray:
+    """Return triplet components as a (3, n) float64 array."""
+    if isinstance(triplets, PFTripletArray):
+        return triplets.values
+    return np.array([(t.a, t.b, t.c) for t in triplets], dtype=np.float64).T
+
+
+# Codes below this bound are counted with bincount; larger or negative codes
+# fall back to np.unique, which sorts instead of allocating a dense table.
+_BINCOUNT_MAX_CODE = 4096
+
+
+def _shannon(codes: np.ndarray) -> float:
+    """Shannon entropy (bits) of the empirical distribution of integer codes."""
+    if 0 <= codes.min() and codes.max() < _BINCOUNT_MAX_CODE:
+        counts = np.bincount(codes)
+        counts = counts[counts > 0]
+    else:
+        _, counts = np.unique(codes, return_counts=True)
+    p = counts / codes.size
+    return float(-(p * np.log2(p)).sum())
+
+
+def _triplet_type_ids(triplets: list[PFTriplet] | PFTripletArray) -> np.ndarray:
+    """Return triplet type codes as an int8 array."""
+    if isinstance(triplets, PFTripletArray):
+        return triplets.type_ids
+    return np.fromiter((t.triplet_type for t in triplets), dtype=np.int8, count=len(triplets))
+
+
+# List length from which compute_entropy counts with NumPy instead of Counter.
+# Measured crossover is ~60 triplets (50: 54 vs 57 µs, 100: 96 vs 79 µs);
+# below that the array setup costs more than Counter saves.
+_ENTROPY_NUMPY_MIN_TRIPLETS = 128
+
+
 def compute_entropy(state: PFManifoldState) -> float:
     """
     Compute entropy measure for a manifold state.
@@ -285,10 +489,23 @@ def compute_entropy(state: PFManifoldState) -> float:
         Entropy scalar
     """
     entropy = 0.0
+    triplets = state.triplets
+    vectorize = HAS_NUMPY and bool(triplets) and (
+        isinstance(triplets, PFTripletArray)
+        or len(triplets) >= _ENTROPY_NUMPY_MIN_TRIPLETS
+    )
+    if vectorize:
+        values = _triplet_values(triplets)
+        # NaN/inf components take the loop below, so the result (or error)
+        # does not depend on which side of the threshold the input falls
+        if not np.isfinite(values).all():
+            vectorize = False
     
     # Triplet frequency entropy
-    if state.triplets:
-        triplet_types = [t.triplet_type for t in state.triplets]
+    if vectorize:
+        entropy += _shannon(_triplet_type_ids(triplets))
+    elif triplets:
+        triplet_types = [t.triplet_type for t in triplets]
         type_counts = collections.Counter(triplet_types)
         total = len(triplet_types)
         
@@ -308,10 +525,13 @@ def compute_entropy(state: PFManifoldState) -> float:
                 entropy += 0.5 * (-p * math.log2(p) if p > 0 else 0.0)
     
     # Combinatorics entropy (from triplet values)
-    if state.triplets:
+    if vectorize:
+        bins = (np.abs(values) * 10).astype(np.int64)
+        entropy += 0.3 * _shannon(bins.ravel())
+    elif triplets:
         value_entropy = 0.0
         all_values = []
-        for triplet in state.triplets:
+        for triplet in triplets:
             all_values.extend([abs(triplet.a), abs(triplet.b), abs(triplet.c)])
         
         if all_values:
@@ -329,19 +549,34 @@ def compute_entropy(state: PFManifoldState) -> float:
     return max(entropy, 0.0)  # Ensure non-negative
 
 
-def triplet_decomposition(tokens: list[str]) -> list[PFTriplet]:
+def triplet_decomposition(
+    tokens: list[str],
+    as_array: bool = False
+) -> list[PFTriplet] | PFTripletArray:
     """
     Decompose tokens into PF triplets.
     
     Converts tokens into presence, trig, and combinatorics triplets
     based on token characteristics and relationships.
 
+    Long token lists are hashed and classified with NumPy in one pass;
+    short ones take the per-group loop below, which gives the same result.
+
     Args:
         tokens: List of input tokens
+        as_array: Return a PFTripletArray instead of a list (needs numpy)
 
     Returns:
-        List of PF triplets
+        List of PF triplets, or a PFTripletArray if as_array is set
+
+    Raises:
+        ImportError: If as_array is set and numpy is not installed
     """
+    if as_array and not HAS_NUMPY:
+        raise ImportError("triplet_decomposition(as_array=True) requires numpy")
+    if HAS_NUMPY and (as_array or len(tokens) >= _VECTORIZE_MIN_TOKENS):
+        return _triplet_decomposition_vectorized(tokens, as_array)
+
     triplets = []
     
     if not tokens:
@@ -353,43 +588,89 @@ def triplet_decomposition(tokens: list[str]) -> list[PFTriplet]:
         
         if len(group) == 3:
             # Convert tokens to numeric values (simplified: use hash/ord)
-            values = [float(hash(t) % 100) / 100.0 for t in group]
+            a, b, c = [float(hash(t) % 100) / 100.0 for t in group]
             
-            # Normalize values
-            max_val = max(values) if values else 1.0
+            # Normalize by the group max. Values start in [0, 0.99], so this
+            # is not a no-op (the max becomes 1.0); only all-zero groups skip it.
+            max_val = max(a, b, c)
             if max_val > 0:
-                values = [v / max_val for v in values]
+                a, b, c = a / max_val, b / max_val, c / max_val
             
             # Determine triplet type based on values
-            a, b, c = values[0], values[1], values[2]
             
             # Check for presence triplet pattern (0, 1, √2)
-            sqrt2 = math.sqrt(2.0)
-            if abs(a) < 0.1 and abs(b - 1.0) < 0.1 and abs(c - sqrt2) < 0.1:
-                triplet_type = "presence"
+            if abs(a) < 0.1 and abs(b - 1.0) < 0.1 and abs(c - _SQRT2) < 0.1:
+                triplet_type = PFTripletType.PRESENCE
             # Check for trig triplet pattern (1, 2, 3)
             elif abs(a - 0.33) < 0.1 and abs(b - 0.67) < 0.1 and abs(c - 1.0) < 0.1:
-                triplet_type = "trig"
+                triplet_type = PFTripletType.TRIG
             # Check for combinatorics pattern (p, p, q)
             elif abs(a - b) < 0.1 and abs(c - a) > 0.1:
-                triplet_type = "combinatorics"
+                triplet_type = PFTripletType.COMBINATORICS
             else:
-                triplet_type = "unknown"
+                triplet_type = PFTripletType.UNKNOWN
             
             triplets.append(PFTriplet(a=a, b=b, c=c, triplet_type=triplet_type))
         elif len(group) == 2:
             # Create triplet with default third value
             values = [float(hash(t) % 100) / 100.0 for t in group]
-            values.append(math.sqrt(2.0))  # Add √2 as third value
-            triplets.append(PFTriplet(a=values[0], b=values[1], c=values[2], triplet_type="presence"))
+            values.append(_SQRT2)  # Add √2 as third value
+            triplets.append(PFTriplet(a=values[0], b=values[1], c=values[2], triplet_type=PFTripletType.PRESENCE))
         elif len(group) == 1:
             # Create presence triplet with single token
             val = float(hash(group[0]) % 100) / 100.0
-            triplets.append(PFTriplet(a=0.0, b=val, c=math.sqrt(2.0), triplet_type="presence"))
+            triplets.append(PFTriplet(a=0.0, b=val, c=_SQRT2, triplet_type=PFTripletType.PRESENCE))
     
     return triplets
 
 
+def _triplet_decomposition_vectorized(
+    tokens: list[str],
+    as_array: bool
+) -> list[PFTriplet] | PFTripletArray:
+    """NumPy version of triplet_decomposition over all full token groups."""
+    n = len(tokens)
+    values = np.fromiter((hash(t) % 100 for t in tokens), dtype=np.int64, count=n) / 100.0
+    full = n - n % 3
+
+    # Full groups: normalize each row by its max, then classify
+    rows = values[:full].reshape(-1, 3)
+    row_max = rows.max(axis=1, keepdims=True) if full else np.ones((0, 1))
+    rows = np.divide(rows, row_max, out=rows.copy(), where=row_max > 0)
+    a, b, c = rows.T
+    presence = (np.abs(a) < 0.1) & (np.abs(b - 1.0) < 0.1) & (np.abs(c - _SQRT2) < 0.1)
+    trig = (np.abs(a - 0.33) < 0.1) & (np.abs(b - 0.67) < 0.1) & (np.abs(c - 1.0) < 0.1)
+    combinatorics = (np.abs(a - b) < 0.1) & (np.abs(c - a) > 0.1)
+    type_ids = np.select(
+        [presence, trig, combinatorics],
+        [PFTripletType.PRESENCE, PFTripletType.TRIG, PFTripletType.COMBINATORICS],
+        default=PFTripletType.UNKNOWN,
+    )
+
+    # Leftover 1-2 tokens become a presence triplet
+    tail = values[full:].tolist()
+    if len(tail) == 2:
+        tail_triplet = PFTriplet(a=tail[0], b=tail[1], c=_SQRT2, triplet_type=PFTripletType.PRESENCE)
+    elif len(tail) == 1:
+        tail_triplet = PFTriplet(a=0.0, b=tail[0], c=_SQRT2, triplet_type=PFTripletType.PRESENCE)
+    else:
+        tail_triplet = None
+
+    if as_array:
+        triplets = PFTripletArray.from_columns(a, b, c, type_ids)
+        if tail_triplet is not None:
+            triplets.append(tail_triplet)
+        return triplets
+
+    triplets = [
+        PFTriplet(a=ta, b=tb, c=tc, triplet_type=_TRIPLET_TYPES[tid])
+        for (ta, tb, tc), tid in zip(rows.tolist(), type_ids.tolist())
+    ]
+    if tail_triplet is not None:
+        triplets.append(tail_triplet)
+    return triplets
+
+
 def validate_flux(state: PFState) -> bool:
     """
     Validate that a flux state is well-formed.
@@ -407,37 +688,25 @@ def validate_flux(state: PFState) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Check shell validity
-    if state.shell not in [PFShell.PRESENCE, PFShell.MEASUREMENT, PFShell.FLUX, PFShell.COLLAPSE]:
-        return False
-    
-    # Check curvature is finite
-    if not math.isfinite(state.curvature):
-        return False
-    
-    # Check entropy is non-negative and finite
-    if state.entropy < 0 or not math.isfinite(state.entropy):
-        return False
-    
-    # Check triplet if present
-    if state.triplet is not None:
-        if not all(math.isfinite(v) for v in [state.triplet.a, state.triplet.b, state.triplet.c]):
-            return False
-    
-    # Check combinatorics if present
-    if state.combinatorics is not None:
-        p1, p2, q = state.combinatorics
-        if p1 <= 0 or p2 <= 0 or q <= 0:
-            return False
-        # Check that p1 == p2 (combinatorics requirement)
-        if abs(p1 - p2) > 0.001:
-            return False
-    
-    # Check lattice position is finite
-    if not math.isfinite(state.lattice_position):
-        return False
-    
-    return True
+    triplet = state.triplet
+    return (
+        state.shell in _VALID_SHELLS
+        and math.isfinite(state.curvature)
+        and state.entropy >= 0
+        and math.isfinite(state.entropy)
+        and (
+            triplet is None
+            or (math.isfinite(triplet.a) and math.isfinite(triplet.b) and math.isfinite(triplet.c))
+        )
+        and (state.combinatorics is None or _valid_combinatorics(state.combinatorics))
+        and math.isfinite(state.lattice_position)
+    )
+
+
+def _valid_combinatorics(combinatorics: tuple[int, int, int]) -> bool:
+    """Check a (p, p, q) structure: positive entries with p1 == p2."""
+    p1, p2, q = combinatorics
+    return p1 > 0 and p2 > 0 and q > 0 and abs(p1 - p2) <= 0.001
 
 
 def next_shell(current_shell: PFShell) -> PFShell:
@@ -452,11 +721,6 @@ def next_shell(current_shell: PFShell) -> PFShell:
     Returns:
         Next shell in sequence
     """
-    transitions = {
-        PFShell.PRESENCE: PFShell.MEASUREMENT,
-        PFShell.MEASUREMENT: PFShell.FLUX,
-        PFShell.FLUX: PFShell.COLLAPSE,
-        PFShell.COLLAPSE: PFShell.PRESENCE,
-    }
-    return transitions.get(current_shell, PFShell.PRESENCE)
-
+    if isinstance(current_shell, PFShell):
+        return _NEXT_SHELL[current_shell.value]
+    return PFShell.PRESENCE
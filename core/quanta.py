@@ -12,12 +12,36 @@ This works from the first capsule.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 import hashlib
 import json
 import zlib
 from ApopToSiS.runtime.capsules import Capsule
 
+# libdeflate is ~2x faster than zlib on single-buffer compression, but its
+# output bytes differ from zlib's, so capsule hashes change when it is used.
+try:
+    import deflate
+    HAS_LIBDEFLATE = True
+except ImportError:
+    deflate = None
+    HAS_LIBDEFLATE = False
+
+_ZLIB_LEVEL = 6
+
+# orjson serializes straight to bytes several times faster than json.dumps,
+# but its compact separators and float formatting give different bytes.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# Shared canonical encoder: same output as json.dumps(obj, sort_keys=True),
+# without rebuilding a JSONEncoder on every call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True)
+
 
 class QuantaCompressor:
     """
@@ -29,6 +53,20 @@ class QuantaCompressor:
     This is fully usable on capsule #1.
     """
 
+    def __init__(self, use_libdeflate: bool = False, use_orjson: bool = False) -> None:
+        """
+        Initialize Quanta compressor.
+
+        Args:
+            use_libdeflate: Compress with libdeflate when it is installed.
+                Off by default because it changes compressed bytes and
+                therefore capsule hashes.
+            use_orjson: Serialize with orjson when it is installed.
+                Off by default for the same reason.
+        """
+        self.use_libdeflate = use_libdeflate and HAS_LIBDEFLATE
+        self.use_orjson = use_orjson and HAS_ORJSON
+
     def compress_capsule(self, capsule: Capsule | dict[str, Any]) -> bytes:
         """
         Compress a capsule.
@@ -42,19 +80,27 @@ class QuantaCompressor:
         Returns:
             Compressed bytes
         """
+        return self._compress_bytes(self._canonical_bytes(capsule))
+
+    def _canonical_bytes(self, capsule: Capsule | dict[str, Any]) -> bytes:
+        """Serialize a capsule to canonical JSON-Flux bytes (sorted keys)."""
         # Convert capsule to dict if needed
         if isinstance(capsule, Capsule):
             capsule_dict = capsule.encode()
         else:
             capsule_dict = capsule
         
-        # Convert capsule to JSON-Flux format
-        raw_json = json.dumps(capsule_dict, sort_keys=True)
-        
-        # Compress using zlib
-        compressed = zlib.compress(raw_json.encode("utf-8"))
-        
-        return compressed
+        if self.use_orjson:
+            return orjson.dumps(
+                capsule_dict, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        return _CANONICAL_ENCODER.encode(capsule_dict).encode("utf-8")
+
+    def _compress_bytes(self, raw_bytes: bytes) -> bytes:
+        """Compress canonical bytes using zlib (or libdeflate's zlib container)."""
+        if self.use_libdeflate:
+            return deflate.zlib_compress(raw_bytes, _ZLIB_LEVEL)
+        return zlib.compress(raw_bytes, _ZLIB_LEVEL)
 
     def hash_capsule(self, capsule: Capsule | dict[str, Any]) -> str:
         """
@@ -79,6 +125,20 @@ class QuantaCompressor:
         
         return hash_value
 
+    def hash_capsules(self, capsules: Iterable[Capsule | dict[str, Any]]) -> list[str]:
+        """
+        Hash a batch of capsules.
+        
+        Calls hash_capsule on each capsule in order.
+
+        Args:
+            capsules: Capsule instances or dictionaries
+
+        Returns:
+            SHA-256 hashes (hex), one per capsule
+        """
+        return [self.hash_capsule(capsule) for capsule in capsules]
+
     def compression_ratio(self, raw: bytes | str, compressed: bytes) -> float:
         """
         Compute compression ratio.
@@ -116,20 +176,11 @@ class QuantaCompressor:
         Returns:
             QuantaCoin value (compression ratio)
         """
-        # Get raw size
-        if isinstance(capsule, Capsule):
-            raw_dict = capsule.encode()
-        else:
-            raw_dict = capsule
-        
-        raw_json = json.dumps(raw_dict, sort_keys=True)
-        raw_size = len(raw_json.encode("utf-8"))
-        
-        # Get compressed size
-        compressed = self.compress_capsule(capsule)
-        compressed_size = len(compressed)
+        # Serialize once; size and compress the same bytes
+        raw_bytes = self._canonical_bytes(capsule)
+        compressed = self._compress_bytes(raw_bytes)
         
         # Compute compression ratio = QuantaCoin
-        quanta = self.compression_ratio(raw_json, compressed)
+        quanta = len(raw_bytes) / max(1, len(compressed))
         
         return quanta
@@ -22,10 +22,14 @@ Flow creates identity continuation.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
 import math
 
+from .numpy_fallback import np, HAS_NUMPY
+
 
 class Shell(Enum):
     """PrimeFlux shell enumeration."""
@@ -35,8 +39,9 @@ class Shell(Enum):
     COLLAPSE = 4
 
 
-# Transition rules: (from_shell, to_shell) -> allowed
-transition_rules: dict[tuple[Shell, Shell], bool] = {
+# Transition rules: (from_shell, to_shell) -> allowed.
+# Read-only: validate_transition reads a lookup table built from these once.
+transition_rules: Mapping[tuple[Shell, Shell], bool] = MappingProxyType({
     (Shell.PRESENCE, Shell.MEASUREMENT): True,
     (Shell.MEASUREMENT, Shell.FLUX): True,
     (Shell.FLUX, Shell.COLLAPSE): True,
@@ -51,7 +56,21 @@ transition_rules: dict[tuple[Shell, Shell], bool] = {
     (Shell.MEASUREMENT, Shell.MEASUREMENT): True,
     (Shell.FLUX, Shell.FLUX): True,
     (Shell.COLLAPSE, Shell.COLLAPSE): True,
-}
+})
+
+
+def _build_transition_lut() -> tuple[bool, ...]:
+    max_value = max(shell.value for shell in Shell)
+    lut = [False] * (((max_value << 3) | max_value) + 1)
+    for (prev, next_shell), allowed in transition_rules.items():
+        lut[(prev.value << 3) | next_shell.value] = allowed
+    return tuple(lut)
+
+
+# Flat lookup table for validate_transition, indexed by
+# (prev.value << 3) | next.value. Shell values fit in 3 bits, so this avoids
+# the tuple allocation and Python-level Enum.__hash__ calls of a dict lookup.
+_TRANSITION_LUT = _build_transition_lut()
 
 
 def validate_transition(prev: Shell, next_shell: Shell) -> bool:
@@ -65,7 +84,30 @@ def validate_transition(prev: Shell, next_shell: Shell) -> bool:
     Returns:
         True if transition is valid, False otherwise
     """
-    return transition_rules.get((prev, next_shell), False)
+    if prev.__class__ is not Shell or next_shell.__class__ is not Shell:
+        return False
+    return _TRANSITION_LUT[(prev._value_ << 3) | next_shell._value_]
+
+
+_SQRT2 = math.sqrt(2.0)
+_HALF_PI = math.pi / 2
+
+
+def _flux_upper_bound() -> float:
+    """Smallest |x| outside the |x - π/2| < 0.5 flux band, exact in floats."""
+    bound = _HALF_PI + 0.5
+    while abs(bound - _HALF_PI) < 0.5:
+        bound = math.nextafter(bound, math.inf)
+    while abs(math.nextafter(bound, 0.0) - _HALF_PI) >= 0.5:
+        bound = math.nextafter(bound, 0.0)
+    return bound
+
+
+# The shell_of_value rules collapse to sorted |x| intervals:
+# [0, 0.001) presence, [0.001, √2) measurement (the "around 1" band lies
+# inside it), [√2, π/2 + 0.5) flux (φ < π/2 + 0.5), and collapse above.
+_SHELL_THRESHOLDS = (0.001, _SQRT2, _flux_upper_bound())
+_SHELL_BY_INTERVAL = (Shell.PRESENCE, Shell.MEASUREMENT, Shell.FLUX, Shell.COLLAPSE)
 
 
 def shell_of_value(x: float) -> Shell:
@@ -84,30 +126,32 @@ def shell_of_value(x: float) -> Shell:
         Shell assignment
     """
     abs_x = abs(x)
-    sqrt2 = math.sqrt(2.0)
-    phi = (1.0 + math.sqrt(5.0)) / 2.0  # Golden ratio
-    pi = math.pi
     
-    # Shell 0: Presence (indistinct)
-    # Values close to 0 or very small
-    if abs_x < 0.001:
-        return Shell.PRESENCE
-    
-    # Shell 2: Measurement (duality)
-    # Values in range [0, √2) or around 1
-    if abs_x < sqrt2 or (abs(abs_x - 1.0) < 0.1):
+    # NaN fails every threshold test: default to measurement
+    if abs_x != abs_x:
         return Shell.MEASUREMENT
     
-    # Shell 3: Flux/Curvature
-    # Values in range [√2, φ) or around π/2
-    if sqrt2 <= abs_x < phi or (abs(abs_x - pi/2) < 0.5):
-        return Shell.FLUX
-    
-    # Shell 4: Collapse (commit)
-    # Values >= φ or large values
-    if abs_x >= phi:
-        return Shell.COLLAPSE
+    return _SHELL_BY_INTERVAL[bisect_right(_SHELL_THRESHOLDS, abs_x)]
+
+
+def shell_of_values(xs: Iterable[float]) -> list[Shell]:
+    """
+    Determine shells for a batch of values.
     
-    # Default to measurement for intermediate values
-    return Shell.MEASUREMENT
+    Equivalent to [shell_of_value(x) for x in xs], classified in one
+    vectorized searchsorted pass when NumPy is available.
 
+    Args:
+        xs: Input values
+
+    Returns:
+        Shell assignment for each value
+    """
+    if not HAS_NUMPY:
+        return [shell_of_value(x) for x in xs]
+    
+    abs_xs = np.abs(np.fromiter(xs, dtype=np.float64))
+    idx = np.searchsorted(_SHELL_THRESHOLDS, abs_xs, side="right")
+    idx[np.isnan(abs_xs)] = 1  # Shell.MEASUREMENT
+    shells = _SHELL_BY_INTERVAL
+    return [shells[i] for i in idx.tolist()]
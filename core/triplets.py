@@ -13,6 +13,8 @@ from enum import Enum
 import math
 from typing import Optional
 
+from .numpy_fallback import np, HAS_NUMPY
+
 
 class TripletType(Enum):
     """Type of PF triplet."""
@@ -36,6 +38,12 @@ class Triplet:
             self.triplet_type = detect_triplet_type(self)
 
 
+# Token count from which make_triplets switches to the NumPy path.
+# Measured crossover is ~75 tokens (60: 59 vs 66 µs loop/NumPy, 90: 87 vs
+# 76 µs, 120: 113 vs 87 µs); below it the per-group loop is faster.
+_VECTORIZE_MIN_TOKENS = 96
+
+
 def make_triplets(tokens: list[str]) -> list[Triplet]:
     """
     Create triplets from tokens.
@@ -54,6 +62,9 @@ def make_triplets(tokens: list[str]) -> list[Triplet]:
     if not tokens:
         return triplets
     
+    if HAS_NUMPY and len(tokens) >= _VECTORIZE_MIN_TOKENS:
+        return _make_triplets_vectorized(tokens)
+    
     sqrt2 = math.sqrt(2.0)
     
     # Process tokens in groups for triplet formation
@@ -144,6 +155,51 @@ def make_triplets(tokens: list[str]) -> list[Triplet]:
     return triplets
 
 
+def _make_triplets_vectorized(tokens: list[str]) -> list[Triplet]:
+    """NumPy version of make_triplets over all full token groups."""
+    sqrt2 = math.sqrt(2.0)
+    n = len(tokens)
+    hash_vals = np.fromiter((abs(hash(t)) % 10000 for t in tokens), dtype=np.int64, count=n)
+    full = n - n % 3
+    
+    # Full groups: normalize each row by its max (all-zero rows stay 0)
+    rows = hash_vals[:full].reshape(-1, 3).astype(np.float64)
+    row_max = rows.max(axis=1, keepdims=True) if full else np.ones((0, 1))
+    rows = np.divide(rows, row_max, out=np.zeros_like(rows), where=row_max > 0)
+    a, b, c = rows.T
+    
+    # Same distances and summation order as the per-group loop
+    dist_to_presence = np.abs(a - 0.0) + np.abs(b - 1.0) + np.abs(c - sqrt2)
+    dist_to_trig = np.abs(a - 1.0/3.0) + np.abs(b - 2.0/3.0) + np.abs(c - 1.0)
+    combinatorics_match = (np.abs(a - b) < 0.1) & (np.abs(c - a) > 0.1)
+    
+    # 0 = presence (also the default), 1 = trig, 2 = combinatorics
+    kinds = np.select(
+        [dist_to_presence < 0.5, dist_to_trig < 0.3, combinatorics_match],
+        [0, 1, 2],
+        default=0,
+    )
+    p = np.maximum(np.where(a > 0, np.trunc(a * 100), 2.0), 2.0)
+    q = np.where(c > 0, np.trunc(c * 100), 3.0)
+    
+    triplets = []
+    append = triplets.append
+    for kind, tp, tq in zip(kinds.tolist(), p.tolist(), q.tolist()):
+        if kind == 1:
+            append(Triplet(a=1.0, b=2.0, c=3.0, triplet_type=TripletType.TRIG))
+        elif kind == 2:
+            append(Triplet(a=tp, b=tp, c=tq, triplet_type=TripletType.COMBINATORICS))
+        else:
+            append(Triplet(a=0.0, b=1.0, c=sqrt2, triplet_type=TripletType.PRESENCE))
+    
+    # Leftover 1-2 tokens: presence triplet keyed on the first leftover token
+    if full < n:
+        val = int(hash_vals[full]) / 10000.0
+        append(Triplet(a=0.0, b=val, c=sqrt2, triplet_type=TripletType.PRESENCE))
+    
+    return triplets
+
+
 def detect_triplet_type(triplet: Triplet) -> TripletType:
     """
     Detect the type of a triplet based on its values.
@@ -0,0 +1,232 @@
+"""
+Test PF Manifold — manifold-level PrimeFlux math tests.
+
+Tests:
+- PFTripletArray storage
+- Curvature and entropy fixed values, with and without NumPy
+- Curvature and entropy agree for list and array triplets
+- Vectorized triplet decomposition
+- Shell transitions
+- Flux validation
+- Next-shell cycle
+- Shell transition lookup table
+- Batched shell classification
+- Vectorized make_triplets
+"""
+
+import math
+import pytest
+from ApopToSiS.core import pf_core
+from ApopToSiS.core.pf_core import (
+    HAS_NUMPY,
+    PFManifoldState,
+    PFShell,
+    PFState,
+    PFTriplet,
+    PFTripletArray,
+    PFTripletType,
+    compute_curvature,
+    compute_entropy,
+    next_shell,
+    transition_shell,
+    validate_flux,
+    triplet_decomposition,
+)
+from ApopToSiS.core.shells import (
+    Shell,
+    shell_of_value,
+    shell_of_values,
+    transition_rules,
+    validate_transition,
+)
+from ApopToSiS.core.triplets import make_triplets
+
+requires_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="requires numpy")
+
+# compute_curvature / compute_entropy of _sample_triplets() with
+# _SAMPLE_HISTORY, from the original pure-Python implementation
+_SAMPLE_HISTORY = [PFShell.PRESENCE, PFShell.MEASUREMENT, PFShell.FLUX]
+_SAMPLE_CURVATURE = 2.859047236452018
+_SAMPLE_ENTROPY = 3.7679700005769243
+
+
+def _sample_triplets():
+    return [
+        PFTriplet(0.0, 1.0, math.sqrt(2.0), "presence"),
+        PFTriplet(0.33, 0.67, 1.0, "trig"),
+        PFTriplet(0.5, 0.5, 0.9, "combinatorics"),
+        PFTriplet(0.12, 0.8, 0.41, "unknown"),
+    ] * 5
+
+
+@requires_numpy
+def test_triplet_array_roundtrip():
+    """Test that PFTripletArray stores and returns triplets row by row."""
+    triplets = _sample_triplets()
+    array = PFTripletArray(triplets[:3])
+    for triplet in triplets[3:]:
+        array.append(triplet)
+
+    assert len(array) == len(triplets)
+    assert array[1] == triplets[1]
+    assert array[-1] == triplets[-1]
+    assert list(array) == triplets
+    assert array.as_tuples()[2] == (0.5, 0.5, 0.9, PFTripletType.COMBINATORICS)
+    assert array.values.shape == (3, len(triplets))
+    assert list(array[-2:]) == triplets[-2:]
+    assert list(array[::4]) == triplets[::4]
+
+
+def test_manifold_math_fixed_values():
+    """Test curvature/entropy of list triplets against known values."""
+    state = PFManifoldState(triplets=_sample_triplets(), shell_history=_SAMPLE_HISTORY)
+    large = PFManifoldState(triplets=_sample_triplets() * 60, shell_history=_SAMPLE_HISTORY)
+
+    assert compute_curvature(state) == pytest.approx(_SAMPLE_CURVATURE, rel=1e-12)
+    assert compute_entropy(state) == pytest.approx(_SAMPLE_ENTROPY, rel=1e-12)
+    assert compute_entropy(large) == pytest.approx(_SAMPLE_ENTROPY, rel=1e-12)
+
+
+def test_manifold_math_without_numpy(monkeypatch):
+    """Test the pure-Python fallback gives the same fixed values."""
+    monkeypatch.setattr(pf_core, "HAS_NUMPY", False)
+    state = PFManifoldState(triplets=_sample_triplets() * 60, shell_history=_SAMPLE_HISTORY)
+    small = PFManifoldState(triplets=_sample_triplets(), shell_history=_SAMPLE_HISTORY)
+
+    assert compute_entropy(small) == pytest.approx(_SAMPLE_ENTROPY, rel=1e-12)
+    assert compute_curvature(small) == pytest.approx(_SAMPLE_CURVATURE, rel=1e-12)
+    assert compute_entropy(state) == pytest.approx(_SAMPLE_ENTROPY, rel=1e-12)
+
+
+@requires_numpy
+def test_manifold_math_matches_for_array_triplets():
+    """Test curvature/entropy of SoA triplets against known values."""
+    triplets = PFTripletArray(_sample_triplets())
+    as_array = PFManifoldState(triplets=triplets, shell_history=_SAMPLE_HISTORY)
+
+    assert compute_curvature(as_array) == pytest.approx(_SAMPLE_CURVATURE)
+    assert compute_entropy(as_array) == pytest.approx(_SAMPLE_ENTROPY)
+
+
+def test_triplet_decomposition_as_array_requires_numpy(monkeypatch):
+    """Test as_array raises instead of returning a list without numpy."""
+    monkeypatch.setattr(pf_core, "HAS_NUMPY", False)
+
+    with pytest.raises(ImportError):
+        triplet_decomposition(["a", "b", "c"], as_array=True)
+    assert isinstance(triplet_decomposition(["a", "b", "c"]), list)
+
+@pytest.mark.parametrize("size", [127, 128, 300])
+def test_entropy_non_finite_matches_loop(monkeypatch, size):
+    """Test NaN/inf triplets give the loop result on both sides of the threshold."""
+    nan_triplets = [PFTriplet(math.nan, 0.5, 1.0, "trig")] + _sample_triplets() * 15
+    state = PFManifoldState(triplets=nan_triplets[:size], shell_history=_SAMPLE_HISTORY)
+    inf_state = PFManifoldState(triplets=[PFTriplet(0.5, math.inf, 1.0)] * size)
+    expected = compute_entropy(state)
+
+    with pytest.raises(OverflowError):
+        compute_entropy(inf_state)
+
+    monkeypatch.setattr(pf_core, "HAS_NUMPY", False)
+    assert compute_entropy(state) == expected
+    with pytest.raises(OverflowError):
+        compute_entropy(inf_state)
+
+@requires_numpy
+def test_triplet_decomposition_vectorized_matches_grouped():
+    """Test that the NumPy decomposition matches the per-group loop."""
+    tokens = [f"token-{i}" for i in range(301)]
+    grouped = []
+    for i in range(0, len(tokens), 3):
+        grouped.extend(triplet_decomposition(tokens[i:i + 3]))
+
+    assert triplet_decomposition(tokens) == grouped
+    assert list(triplet_decomposition(tokens, as_array=True)) == grouped
+
+
+def test_triplet_type_accepts_legacy_labels():
+    """Test that string triplet types are coerced to PFTripletType."""
+    assert PFTriplet(0.0, 1.0, 1.414, "presence").triplet_type is PFTripletType.PRESENCE
+    assert PFTriplet(1.0, 2.0, 3.0, "other").triplet_type is PFTripletType.UNKNOWN
+    assert PFTripletType.TRIG.label == "trig"
+
+
+def test_transition_shell_copy_and_inplace():
+    """Test transition_shell copies by default and mutates when inplace."""
+    state = PFState(shell=PFShell.MEASUREMENT, value=0.4, metadata={"k": 1})
+
+    moved = transition_shell(state)
+    assert moved is not state
+    assert moved.shell == PFShell.FLUX
+    assert moved.measurement_error == pytest.approx(0.4)
+    assert moved.metadata is state.metadata
+    assert state.shell == PFShell.MEASUREMENT
+
+    assert transition_shell(state, inplace=True) is state
+    assert state.shell == PFShell.FLUX
+
+
+def test_validate_flux_rejects_malformed_states():
+    """Test validate_flux accepts a well-formed state and rejects bad fields."""
+    triplet = PFTriplet(0.0, 1.0, math.sqrt(2.0), "presence")
+    assert validate_flux(PFState(shell=PFShell.FLUX, triplet=triplet, combinatorics=(3, 3, 5)))
+
+    assert not validate_flux(PFState(shell=Shell.FLUX))
+    assert not validate_flux(PFState(curvature=math.inf))
+    assert not validate_flux(PFState(curvature=math.nan))
+    assert not validate_flux(PFState(entropy=-0.1))
+    assert not validate_flux(PFState(entropy=math.inf))
+    assert not validate_flux(PFState(triplet=PFTriplet(0.0, math.nan, 1.0)))
+    assert not validate_flux(PFState(combinatorics=(3, 4, 5)))
+    assert not validate_flux(PFState(combinatorics=(0, 0, 5)))
+    assert not validate_flux(PFState(combinatorics=(3, 3, -1)))
+    assert not validate_flux(PFState(lattice_position=-math.inf))
+
+
+def test_next_shell_cycle_and_fallback():
+    """Test the 0 → 2 → 3 → 4 → 0 cycle and the non-PFShell fallback."""
+    assert next_shell(PFShell.PRESENCE) == PFShell.MEASUREMENT
+    assert next_shell(PFShell.MEASUREMENT) == PFShell.FLUX
+    assert next_shell(PFShell.FLUX) == PFShell.COLLAPSE
+    assert next_shell(PFShell.COLLAPSE) == PFShell.PRESENCE
+
+    assert next_shell(Shell.FLUX) == PFShell.PRESENCE
+    assert next_shell(3) == PFShell.PRESENCE
+    assert next_shell(None) == PFShell.PRESENCE
+
+
+def test_validate_transition_matches_rules():
+    """Test the transition lookup table against transition_rules."""
+    for prev in Shell:
+        for next_shell in Shell:
+            expected = transition_rules.get((prev, next_shell), False)
+            assert validate_transition(prev, next_shell) is expected
+
+    assert validate_transition(PFShell.PRESENCE, PFShell.MEASUREMENT) is False
+    assert validate_transition(0, 2) is False
+    assert validate_transition(Shell.PRESENCE, None) is False
+    with pytest.raises(TypeError):
+        transition_rules[(Shell.FLUX, Shell.PRESENCE)] = True
+
+
+def test_shell_of_values_matches_scalar():
+    """Test batched shell classification at thresholds, infinities and NaN."""
+    values = [0.0, 0.0009, 0.001, -1.0, math.sqrt(2.0), 1.9, math.pi / 2 + 0.5,
+              -3.0, math.inf, math.nan]
+
+    assert shell_of_values(values) == [shell_of_value(x) for x in values]
+    assert shell_of_values(x for x in values) == [shell_of_value(x) for x in values]
+    with pytest.raises((TypeError, ValueError)):
+        shell_of_values([[0.5], [2.0]])
+    assert shell_of_value(math.nan) == Shell.MEASUREMENT
+    assert shell_of_value(math.sqrt(2.0)) == Shell.FLUX
+
+
+def test_make_triplets_vectorized_matches_grouped():
+    """Test that vectorized make_triplets matches the per-group loop."""
+    tokens = [f"tok-{i}" for i in range(3002)]
+    grouped = []
+    for i in range(0, len(tokens), 3):
+        grouped.extend(make_triplets(tokens[i:i + 3]))
+
+    assert make_triplets(tokens) == grouped
@@ -86,3 +86,21 @@ def test_quanta_compression_ratio():
     assert ratio > 0
     assert isinstance(ratio, float)
 
+
+
+def test_quanta_batch_hashing():
+    """Test batch hashing matches per-capsule hashing."""
+    compressor = QuantaCompressor()
+    
+    def make_capsules():
+        return [
+            Capsule(raw_tokens=["batch", str(i)], entropy=0.1 * i, shell=2,
+                    timestamp=1.0, capsule_id=f"c{i}", device_id="d", session_id="s")
+            for i in range(5)
+        ]
+    
+    capsules = make_capsules()
+    hashes = compressor.hash_capsules(capsules)
+    
+    assert hashes == [compressor.hash_capsule(c) for c in make_capsules()]
+    assert all(c.quanta_hash == h for c, h in zip(capsules, hashes))